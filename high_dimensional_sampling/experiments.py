@@ -1,16 +1,120 @@
 from abc import ABC, abstractmethod
 import os
+import csv
+import struct
 import getpass
 import yaml
-import copy
+import functools
+import multiprocessing
 import numpy as np
+from numpy.lib import format as npy_format
 
-from .utils import (get_time, get_datetime, create_unique_folder,
-                    benchmark_matrix_inverse, benchmark_sha_hashing)
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
+from .utils import (get_time, get_precise_time, get_datetime,
+                    create_unique_folder, benchmark_matrix_inverse,
+                    benchmark_sha_hashing)
 from .procedures import Procedure
 from .functions import TestFunction, MLFunction
 
 
+# Size in bytes of the write buffer used for each of the log files
+LOG_BUFFER_SIZE = 1 << 20
+# Number of buffered procedure and function call lines after which they are
+# written to their log files
+CALLS_BUFFER_LINES = 1024
+# Benchmark results of this process, shared by all Logger instances
+_BENCHMARK_CACHE = None
+# Headers of samples.csv files, keyed by the number of x and y columns
+_HEADER_CACHE = {}
+# Total size in bytes of the header of samples.npy files. The header has a
+# fixed size, so that it can be rewritten with the final number of samples
+# when the file is closed.
+NPY_HEADER_SIZE = 128
+
+
+@functools.lru_cache(maxsize=None)
+def _get_user():
+    """
+    Returns the name of the user running the experiments. The name is looked
+    up only once per process.
+
+    Returns:
+        String containing the login name of the user
+    """
+    return getpass.getuser()
+
+
+def _run_experiment_worker(arguments):
+    """
+    Runs a single experiment in a worker process of Experiment.run_parallel.
+
+    A fresh Experiment (and with that a fresh Logger and its file handles) is
+    created inside the worker, so that no open handles need to be pickled.
+
+    Args:
+        arguments: Tuple containing the Experiment class, the procedure (or
+            procedure factory), the logging path, the test function, the
+            verbosity, the configuration callable (or None) and a dictionary
+            with arguments for the run() method.
+    """
+    (cls, procedure, path, function, verbose, configure,
+     run_kwargs) = arguments
+    if not isinstance(procedure, Procedure):
+        procedure = procedure()
+    experiment = cls(procedure, path, verbose)
+    if configure is not None:
+        configure(experiment)
+    experiment.run(function, **run_kwargs)
+
+
+def _to_yaml_value(value):
+    """
+    Converts a value to a type that can be stored in a .yaml-file. Numpy arrays
+    are converted to (nested) lists, all other values are returned unchanged.
+
+    Args:
+        value: Value to convert.
+
+    Returns:
+        The converted value.
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return value
+
+
+def log_benchmarks(path):
+    """
+    Benchmark the machine with some simple benchmark algorithms (as
+    implemented in the utils module) and store the results in the
+    benchmarks.yaml file in the provided folder.
+
+    If this file already exists, no benchmarks are run. The benchmarks are run
+    only once per process: subsequent calls with a different path write the
+    results of the first run.
+
+    Args:
+        path: Path of the folder in which the benchmarks.yaml file should be
+            created.
+    """
+    global _BENCHMARK_CACHE
+    path_benchmarks = os.path.join(path, "benchmarks.yaml")
+    if os.path.exists(path_benchmarks):
+        return
+    if _BENCHMARK_CACHE is None:
+        _BENCHMARK_CACHE = {
+            'matrix_inversion': benchmark_matrix_inverse(),
+            'sha_hashing': benchmark_sha_hashing(),
+        }
+    with open(path_benchmarks, "w") as handle:
+        info = {'benchmarks': dict(_BENCHMARK_CACHE)}
+        yaml.dump(info, handle, Dumper=YamlDumper, default_flow_style=False)
+
+
 class Experiment(ABC):
     """
     Base class for performing experiments on Procedures with TestFunctions
@@ -39,8 +143,11 @@ class Experiment(ABC):
         self.procedure = procedure
         self.logger = None
         self.verbose = int(verbose)
+        self.n_sampled = 0
+        self.finish_line = None
 
-    def _perform_experiment(self, function, log_data=True):
+    def _perform_experiment(self, function, log_data=True,
+                            binary_logging=False):
         """
         Run the experiment.
 
@@ -56,6 +163,10 @@ class Experiment(ABC):
                 base class.
             log_data: Boolean indicating if the sampled data should be logged
                 as well. It is set to True by default.
+            binary_logging: Boolean indicating if the sampled data should be
+                logged in binary numpy format (samples.npy) instead of as csv
+                (samples.csv). See the Logger class for more information. It is
+                set to False by default.
             finish_line: If the total sampled data set reaches or exceeds this
                 size, the experiment is stopped. This is a hard stop, not a
                 stopping condition that has to be met: if the procedure being
@@ -84,69 +195,87 @@ class Experiment(ABC):
             type(self.procedure).__name__, function.name))
         self._event_start_experiment()
         # Setup logger
-        self.logger = Logger(self.path, (function.name).lower())
+        self.logger = Logger(self.path, (function.name).lower(),
+                             binary_logging)
         self.logger.log_experiment(self, function)
         self.logger.log_benchmarks()
         # Make function available both to the Experiment and the Procedure
         self.function = function
         self.procedure.reset()
         self.procedure.function = self.function
-        # Perform sampling as long as procedure is not finished
-        is_finished = False
-        n_sampled = 0
-        n_functioncalls = 0
-        n_derivativecalls = 0
-        t_experiment_start = get_time()
-        while not is_finished:
-            self.logger.procedure_calls += 1
-            # Perform an procedure iteration and keep track of time elapsed
-            t_start = get_time()
-            x, y = self.procedure(self.function)
-            dt = get_time() - t_start
-            # Reshape output arrays to match expectation
-            if len(x.shape) == 1:
-                if x.shape[0] == self.function.get_dimensionality():
-                    x = x.reshape((1, -1))
-                else:
-                    x = x.reshape((-1, 1))
-            if len(y.shape) == 1:
-                y = y.reshape((len(x), 1))
-            self._event_new_samples(x, y)
-            # Log procedure call
-            n = len(x)
-            n_sampled += n
-            if self.verbose != 0:
-                if self.logger.procedure_calls % self.verbose == 0:
-                    print("{} samples taken in {} procedure calls".format(
-                        n_sampled, self.logger.procedure_calls))
-            self.logger.log_procedure_calls(dt, n_sampled, n)
-            # Log sampled data
-            if log_data:
-                self.logger.log_samples(x, y)
-            # Log function calls and reset the counter
-            n_functioncalls += self.function.count_calls("normal")[1]
-            n_derivativecalls += self.function.count_calls("derivative")[1]
-            self.logger.log_function_calls(self.function)
-            self.function.reset()
-            # Check if the experiment has to stop and update the while
-            # condition to control this.
-            is_finished = (self.procedure.is_finished()
-                           or self._stop_experiment(x, y))
-        if self.verbose:
-            print(
-                "Experiment finished with {} procedure calls and {} samples.".
-                format(self.logger.procedure_calls, n_sampled))
-        self._event_end_experiment()
-        # Log result metrics
-        t_experiment_end = get_time()
-        metrics = {
-            'time': (t_experiment_end - t_experiment_start),
-            'n_functioncalls': n_functioncalls,
-            'n_derivativecalls': n_derivativecalls
-        }
-        metrics = {**metrics, **self.make_metrics()}
-        self.logger.log_results(metrics)
-        # Delete the logger to close all handles
+        # Bind everything used in the sampling loop to local names, to avoid
+        # repeated attribute lookups in each iteration
+        logger = self.logger
+        procedure = self.procedure
+        verbose = self.verbose
+        dimensionality = function.get_dimensionality()
+        log_procedure_calls = logger.log_procedure_calls
+        log_samples = logger.log_samples
+        log_function_calls = logger.log_function_calls
+        event_new_samples = self._event_new_samples
+        procedure_is_finished = procedure.is_finished
+        stop_experiment = self._stop_experiment
+        count_calls = function.count_calls
+        try:
+            # Perform sampling as long as procedure is not finished
+            is_finished = False
+            self.n_sampled = 0
+            n_functioncalls = 0
+            n_derivativecalls = 0
+            t_experiment_start = get_time()
+            while not is_finished:
+                logger.procedure_calls += 1
+                # Perform an procedure iteration and keep track of time elapsed
+                t_start = get_precise_time()
+                x, y = procedure(function)
+                dt = get_precise_time() - t_start
+                # Reshape output arrays to match expectation
+                if len(x.shape) == 1:
+                    if x.shape[0] == dimensionality:
+                        x = x.reshape((1, -1))
+                    else:
+                        x = x.reshape((-1, 1))
+                if len(y.shape) == 1:
+                    y = y.reshape((len(x), 1))
+                event_new_samples(x, y)
+                # Log procedure call
+                n = len(x)
+                self.n_sampled += n
+                if verbose != 0:
+                    if logger.procedure_calls % verbose == 0:
+                        print("{} samples taken in {} procedure calls".format(
+                            self.n_sampled, logger.procedure_calls))
+                log_procedure_calls(dt, self.n_sampled, n)
+                # Log sampled data
+                if log_data:
+                    log_samples(x, y)
+                # Log function calls and reset the counter
+                n_functioncalls += count_calls("normal")[1]
+                n_derivativecalls += count_calls("derivative")[1]
+                log_function_calls(function)
+                function.reset()
+                # Check if the experiment has to stop and update the while
+                # condition to control this.
+                is_finished = procedure_is_finished() or stop_experiment(x, y)
+            if self.verbose:
+                print("Experiment finished with {} procedure calls and {} "
+                      "samples.".format(logger.procedure_calls,
+                                        self.n_sampled))
+            self._event_end_experiment()
+            # Log result metrics
+            t_experiment_end = get_time()
+            metrics = {
+                'time': (t_experiment_end - t_experiment_start),
+                'n_functioncalls': n_functioncalls,
+                'n_derivativecalls': n_derivativecalls
+            }
+            metrics = {**metrics, **self.make_metrics()}
+            self.logger.log_results(metrics)
+        finally:
+            # Write all buffered log rows and close the handles, also when the
+            # procedure raised an exception halfway through the experiment
+            logger.flush(close=True)
+        # Remove the logger, as all its handles are closed now
         del (self.logger)
 
     def _stop_experiment(self, x, y):
@@ -154,6 +283,10 @@ class Experiment(ABC):
         Uses the stopping criterion defined in the .run() method to determine
         if the experiment should be stopped.
 
+        The total number of sampled datapoints is tracked in the n_sampled
+        property, which already includes the provided samples when this
+        method is called.
+
         Args:
             x: Sampled data in the form of a numpy.ndarray of shape
                 (nDatapoints, nVariables).
@@ -164,10 +297,8 @@ class Experiment(ABC):
             Boolean indicating if the experiment should be stopped (i.e. the
             stopping criterion is reached).
         """
-        self.n_sampled += len(x)
-        if self.n_sampled >= self.finish_line:
-            return True
-        return False
+        return (self.finish_line is not None
+                and self.n_sampled >= self.finish_line)
 
     @abstractmethod
     def make_metrics(self):
@@ -220,7 +351,11 @@ class Experiment(ABC):
         """
         pass
 
-    def run(self, function, finish_line=1000, log_data=True):
+    def run(self,
+            function,
+            finish_line=1000,
+            log_data=True,
+            binary_logging=False):
         """
         Run the experiment on the provided test function.
 
@@ -241,10 +376,74 @@ class Experiment(ABC):
                 it is finished.
             log_data: Boolean indicating if the sampled data should be logged
                 as well. It is set to True by default.
+            binary_logging: Boolean indicating if the sampled data should be
+                logged in binary numpy format (samples.npy) instead of as csv
+                (samples.csv). Binary logging is considerably faster for large
+                and high-dimensional data sets. It is set to False by default.
         """
         self.finish_line = finish_line
-        self.n_sampled = 0
-        self._perform_experiment(function, log_data)
+        self._perform_experiment(function, log_data, binary_logging)
+
+    @classmethod
+    def run_parallel(cls,
+                     procedure,
+                     path,
+                     functions,
+                     n_workers=None,
+                     verbose=False,
+                     configure=None,
+                     **run_kwargs):
+        """
+        Run independent experiments on multiple test functions in parallel.
+
+        Each test function is handled by a separate worker process, which
+        creates its own Experiment of the class this method is called on and
+        runs it on the test function. Every experiment is logged to its own
+        subfolder of `path`, exactly as the run() method would. The machine
+        benchmarks are run once, before the workers are started.
+
+        Both the procedure and the test functions are pickled to be sent to
+        the worker processes. If the procedure can not be pickled, a factory
+        (e.g. the Procedure class itself) can be provided instead, which will
+        be called without arguments in each worker to create the procedure.
+
+        As the experiments are created inside the workers, setup that would
+        normally be done on an experiment instance before calling run() (e.g.
+        calling OptimisationExperiment.detect_multiple_minima) has to be
+        provided through the `configure` argument. For example:
+
+            configure = functools.partial(
+                OptimisationExperiment.detect_multiple_minima,
+                threshold_x=0.5,
+                tollerance_y=0.1)
+
+        Args:
+            procedure: Either an instance of a Procedure derived class, of
+                which each worker gets its own copy, or a picklable callable
+                that returns such an instance.
+            path: Path to which the experiments should write their logs.
+            functions: Iterable of test functions to run the experiments on.
+                These should be instances of classes with the
+                functions.TestFunction class as base class.
+            n_workers: Number of worker processes to use. If None (default),
+                the number of CPUs is used.
+            verbose: Verbosity of the experiments, see the documentation of
+                the Experiment class. Defaults to False, as output of the
+                different workers would be interleaved.
+            configure: Picklable callable that is called with each created
+                experiment as its only argument, before the experiment is run.
+                If None (default), the experiments are run without additional
+                setup.
+            **run_kwargs: Additional arguments passed to the run() method of
+                each experiment (e.g. `finish_line`, `log_data` and
+                `binary_logging`).
+        """
+        os.makedirs(path, exist_ok=True)
+        log_benchmarks(path)
+        arguments = [(cls, procedure, path, function, verbose, configure,
+                      run_kwargs) for function in functions]
+        with multiprocessing.Pool(n_workers) as pool:
+            pool.map(_run_experiment_worker, arguments)
 
 
 class OptimisationExperiment(Experiment):
@@ -296,7 +495,7 @@ class OptimisationExperiment(Experiment):
         else:
             x_candi = np.vstack((x, np.array(previous_x)))
             y_candi = np.vstack((y, np.array(previous_y)))
-        minimum = np.amin(y)
+        minimum = np.amin(y_candi)
         # Select based on y_threshold
         indices = np.argwhere(
             y_candi.flatten() <= minimum + self.tollerance_y).flatten()
@@ -328,6 +527,7 @@ class OptimisationExperiment(Experiment):
         """
         self.best_x = None
         self.best_y = None
+        self.best_value = float('inf')
 
     def _event_end_experiment(self):
         """
@@ -341,7 +541,10 @@ class OptimisationExperiment(Experiment):
         procedure.
 
         This implementation checks all sampled points and their function values
-        and stores the (x,y) pair that has the lowest function value.
+        and stores the (x,y) pair that has the lowest function value. The
+        lowest function value found so far is tracked incrementally, so that
+        batches that cannot contain a (secundary) minimum are skipped without
+        searching through the candidate minima.
 
         Args:
             x: Sampled data in the form of a numpy.ndarray of shape
@@ -349,6 +552,10 @@ class OptimisationExperiment(Experiment):
             y: Function values for the samples datapoints of shape
                 (nDatapoints, ?)
         """
+        minimum = float(y.min())
+        if minimum > self.best_value + self.tollerance_y:
+            return
+        self.best_value = min(self.best_value, minimum)
         self.best_x, self.best_y = self._find_minima(x, y, self.best_x,
                                                      self.best_y)
 
@@ -433,37 +640,140 @@ class Logger:
         prefered_subfolder: Name of the folder to be created in the logging
             path. The folder is created with the utils.create_unique_folder
             function, so naming conflicts will be automatically resolved.
+        binary_logging: Boolean indicating if samples should be logged in
+            binary numpy format instead of as csv. If True, the samples are
+            streamed to the samples.npy file, which contains a single array of
+            shape (nSamples, 1 + nVariables + nTargetVariables) with the same
+            columns as the csv file would have. Its header is updated with the
+            number of samples each time the Logger is flushed, after which the
+            file can be read with numpy.load. The file is only created once
+            samples are logged. It is set to False by default.
     """
-    def __init__(self, path, prefered_subfolder):
+    def __init__(self, path, prefered_subfolder, binary_logging=False):
         self.basepath = path
         self.path = create_unique_folder(path, prefered_subfolder)
+        self.binary_logging = binary_logging
+        self.path_experiment = os.path.join(self.path, "experiment.yaml")
+        if binary_logging:
+            self.path_samples = os.path.join(self.path, "samples.npy")
+        else:
+            self.path_samples = os.path.join(self.path, "samples.csv")
+        self.path_functioncalls = os.path.join(self.path, "functioncalls.csv")
+        self.path_procedurecalls = os.path.join(self.path,
+                                                "procedurecalls.csv")
         self.procedure_calls = 0
         self.create_samples_header = True
         self._create_handles()
 
     def __del__(self):
         """
-        Closes all the opened handles at deletion of the instance.
+        Flushes and closes all the opened handles at deletion of the instance.
+        """
+        self.flush(close=True)
+
+    def flush(self, close=False):
         """
+        Write all buffered log lines to their files and flush the file handles.
+
+        If samples are logged in binary format, the header of the samples.npy
+        file is updated with the number of samples written so far.
+
+        Args:
+            close: Boolean indicating if the handles should be closed after
+                flushing. It is set to False by default.
+        """
+        self._write_buffers()
+        if (getattr(self, 'binary_logging', False)
+                and hasattr(self, 'handle_samples')
+                and not self.handle_samples.closed):
+            self._write_npy_header()
+            self.handle_samples.seek(0, os.SEEK_END)
         handles = ["samples", "functioncalls", "procedurecalls"]
-        for handle in handles:
-            if hasattr(self, 'handle_' + handle):
-                getattr(self, 'handle_' + handle).close()
+        for name in handles:
+            if hasattr(self, 'handle_' + name):
+                handle = getattr(self, 'handle_' + name)
+                if not handle.closed:
+                    handle.flush()
+                    if close:
+                        handle.close()
+
+    def _write_npy_header(self):
+        """
+        Write the header of the samples.npy file, describing an array of
+        float64 values with the number of rows and columns logged so far.
+
+        The header is padded to NPY_HEADER_SIZE bytes, so that it can be
+        rewritten in place when more samples have been logged.
+        """
+        header = repr({
+            'descr': npy_format.dtype_to_descr(np.dtype('<f8')),
+            'fortran_order': False,
+            'shape': (self.samples_rows, self.samples_columns),
+        })
+        magic = npy_format.magic(1, 0)
+        header_length = NPY_HEADER_SIZE - len(magic) - 2
+        header = header.ljust(header_length - 1) + '\n'
+        self.handle_samples.seek(0)
+        self.handle_samples.write(magic + struct.pack('<H', header_length) +
+                                  header.encode('latin1'))
+
+    def _write_buffers(self, minimum_size=0):
+        """
+        Write the buffered procedure and function call rows to their log
+        files if the buffers contain more than a minimum number of rows.
+
+        Args:
+            minimum_size: Minimum number of rows a buffer should contain
+                before it is written. Defaults to 0, writing all buffers.
+        """
+        buffers = ["functioncalls", "procedurecalls"]
+        for name in buffers:
+            if not hasattr(self, 'buffer_' + name):
+                continue
+            buffer = getattr(self, 'buffer_' + name)
+            if buffer and len(buffer) >= minimum_size:
+                if not getattr(self, 'handle_' + name).closed:
+                    getattr(self, 'writer_' + name).writerows(buffer)
+                buffer.clear()
 
     def _create_handles(self):
         """
         Creates the file handles needed for logging. Created csv files also get
         their headers added if already possible.
-        """
-        self.handle_samples = open(self.path + os.sep + "samples.csv", "w")
-        self.handle_functioncalls = open(
-            self.path + os.sep + "functioncalls.csv", "w")
-        self.handle_functioncalls.write(
-            'procedure_call_id,n_queried,dt,asked_for_derivative\n')
-        self.handle_procedurecalls = open(
-            self.path + os.sep + "procedurecalls.csv", "w")
-        self.handle_procedurecalls.write(
-            'procedure_call_id,dt,total_dataset_size,new_data_generated\n')
+
+        All files are opened with a large write buffer, as they are written to
+        in bulk and only flushed when the Logger is deleted. Rows for the
+        function calls and procedure calls files are collected in buffers and
+        written to file in chunks of CALLS_BUFFER_LINES rows, through
+        csv.writer instances. Rows for the samples file are formatted directly
+        by log_samples. If samples are logged in binary format, the samples
+        file is only created by log_samples, once there are samples to log.
+        """
+        if not self.binary_logging:
+            self.handle_samples = open(self.path_samples,
+                                       "w",
+                                       buffering=LOG_BUFFER_SIZE,
+                                       newline='')
+        self.handle_functioncalls = open(self.path_functioncalls,
+                                         "w",
+                                         buffering=LOG_BUFFER_SIZE,
+                                         newline='')
+        self.writer_functioncalls = csv.writer(self.handle_functioncalls,
+                                               lineterminator='\n')
+        self.writer_functioncalls.writerow(
+            ['procedure_call_id', 'n_queried', 'dt', 'asked_for_derivative'])
+        self.handle_procedurecalls = open(self.path_procedurecalls,
+                                          "w",
+                                          buffering=LOG_BUFFER_SIZE,
+                                          newline='')
+        self.writer_procedurecalls = csv.writer(self.handle_procedurecalls,
+                                                lineterminator='\n')
+        self.writer_procedurecalls.writerow([
+            'procedure_call_id', 'dt', 'total_dataset_size',
+            'new_data_generated'
+        ])
+        self.buffer_functioncalls = []
+        self.buffer_procedurecalls = []
 
     def log_samples(self, x, y):
         """
@@ -473,7 +783,9 @@ class Logger:
         created at initialisation of the Logger object. As this is the first
         moment we know how many parameters the problem has, this function will
         create a header in this file as well if it is called for the first
-        time.
+        time. If the Logger was created with binary_logging, the data is
+        appended to the samples.npy file as raw float64 values instead, which
+        is created the first time this function is called.
 
         Args:
             x: numpy.ndarray of shape (nDatapoints, nVariables) containing the
@@ -481,44 +793,55 @@ class Logger:
             y: numpy.ndarray of shape (nDatapoints, nTargetVariables)
                 containing the sampled function values of the test function.
         """
-        # Create header
+        # Append binary data without conversion to strings
+        if self.binary_logging:
+            ids = np.full((len(x), 1), self.procedure_calls, dtype=float)
+            data = np.hstack((ids, x, y)).astype('<f8')
+            if not hasattr(self, 'handle_samples'):
+                self.handle_samples = open(self.path_samples, "wb",
+                                           buffering=LOG_BUFFER_SIZE)
+                self.samples_rows = 0
+                self.samples_columns = data.shape[1]
+                self._write_npy_header()
+            self.handle_samples.write(data.tobytes())
+            self.samples_rows += len(data)
+            return
+        # Create header, reusing the header of earlier experiments with the
+        # same number of columns if possible
         if self.create_samples_header:
-            header = ['procedure_call_id']
-            header += ['x' + str(i) for i in range(len(x[0]))]
-            header += ['y' + str(i) for i in range(len(y[0]))]
-            self.handle_samples.write(",".join(header) + "\n")
+            key = (len(x[0]), len(y[0]))
+            if key not in _HEADER_CACHE:
+                header = ['procedure_call_id']
+                header += ['x' + str(i) for i in range(key[0])]
+                header += ['y' + str(i) for i in range(key[1])]
+                _HEADER_CACHE[key] = ",".join(header) + "\n"
+            self.handle_samples.write(_HEADER_CACHE[key])
             self.create_samples_header = False
-        # Create and write line
-        n_datapoints = len(x)
-        points = x.astype(str).tolist()
-        labels = y.astype(str).tolist()
-        for i in range(n_datapoints):
-            line = [str(self.procedure_calls)]
-            line += points[i]
-            line += labels[i]
-            self.handle_samples.write(','.join(line) + "\n")
-        self.handle_samples.flush()
+        # Convert all values to strings in a single call and write all rows,
+        # prefixed with the procedure call id, as one block
+        prefix = str(self.procedure_calls) + ','
+        rows = np.hstack((x, y)).astype(str).tolist()
+        self.handle_samples.write(
+            ''.join([prefix + ','.join(row) + '\n' for row in rows]))
 
     def log_procedure_calls(self, dt, size_total, size_generated):
         """
         Log a procedure call to the procedurecalls.csv file.
 
         Args:
-            dt: Time in ms spend on the procedure call.
+            dt: Time in seconds spend on the procedure call.
             size_total: Number of data points sampled in total for all
                 procedure calls so far. This should include the data points
                 sampled in the iteration that is currently sampled.
             size_generated: Number of data points sampled in this specific
                 procedure call.
         """
-        line = [
+        self.buffer_procedurecalls.append([
             int(self.procedure_calls), dt,
             int(size_total),
             int(size_generated)
-        ]
-        line = list(map(str, line))
-        self.handle_procedurecalls.write(','.join(line) + "\n")
-        self.handle_procedurecalls.flush()
+        ])
+        self._write_buffers(CALLS_BUFFER_LINES)
 
     def log_function_calls(self, function):
         """
@@ -532,35 +855,23 @@ class Logger:
                 This test function should be a class with
                 functions.TestFunction as its base class.
         """
-        for entry in function.counter:
-            line = [
-                int(self.procedure_calls),
-                int(entry[0]),
-                float(entry[1]),
-                bool(entry[2])
-            ]
-            line = list(map(str, line))
-            self.handle_functioncalls.write(','.join(line) + "\n")
-            self.handle_functioncalls.flush()
+        procedure_call = int(self.procedure_calls)
+        self.buffer_functioncalls.extend(
+            [procedure_call,
+             int(entry[0]),
+             float(entry[1]),
+             bool(entry[2])] for entry in function.counter)
+        self._write_buffers(CALLS_BUFFER_LINES)
 
     def log_benchmarks(self):
         """
         Benchmark the machine with some simple benchmark algorithms (as
         implemented in the utils module).
 
-        Results are stored in the base log path in the benchmarks.yaml file. If
-        this file already exists, no benchmarks are run.
+        Results are stored in the base log path in the benchmarks.yaml file.
+        See the module-level log_benchmarks function for more information.
         """
-        if os.path.exists(self.basepath + os.sep + "benchmarks.yaml"):
-            return
-        with open(self.basepath + os.sep + "benchmarks.yaml", "w") as handle:
-            info = {}
-            # Get meta data of experiment
-            info['benchmarks'] = {
-                'matrix_inversion': benchmark_matrix_inverse(),
-                'sha_hashing': benchmark_sha_hashing(),
-            }
-            yaml.dump(info, handle, default_flow_style=False)
+        log_benchmarks(self.basepath)
 
     def log_experiment(self, experiment, function):
         """
@@ -576,46 +887,45 @@ class Logger:
                 This test function should be a class with
                 functions.TestFunction as its base class.
         """
-        with open(self.path + os.sep + "experiment.yaml", "w") as handle:
+        with open(self.path_experiment, "w") as handle:
             info = {}
             # Get meta data of experiment
             info['meta'] = {
                 'datetime': str(get_datetime()),
                 'timestamp': str(get_time()),
-                'user': getpass.getuser(),
+                'user': _get_user(),
             }
             # Get properties of function
-            func_props = copy.copy(vars(function))
+            excluded = ['counter']
             if isinstance(function, MLFunction):
-                del(func_props['model'])
-            for prop in func_props:
-                if prop == 'name':
-                    continue
-                if isinstance(func_props[prop], np.ndarray):
-                    func_props[prop] = func_props[prop].tolist()
+                excluded.append('model')
+            func_props = {
+                prop: _to_yaml_value(value)
+                for prop, value in vars(function).items()
+                if prop not in excluded
+            }
             info['function'] = {
                 'name': function.name,
                 'testfunction': type(function).__name__,
                 'properties': func_props
             }
-            del (info['function']['properties']['counter'])
             # Get properties of experiment
+            procedure = experiment.procedure
             info['procedure'] = {
-                'name': type(experiment.procedure).__name__,
-                'properties': {}
+                'name': type(procedure).__name__,
+                'properties': {
+                    prop: _to_yaml_value(getattr(procedure, prop))
+                    for prop in procedure.store_parameters
+                }
             }
             info['experiment'] = {
                 'type': experiment.__class__.__name__,
             }
-            for prop in experiment.procedure.store_parameters:
-                info['procedure']['properties'][prop] = getattr(
-                    experiment.procedure, prop)
-                if isinstance(info['procedure']['properties'][prop],
-                              np.ndarray):
-                    info['procedure']['properties'][prop] = info['procedure'][
-                        'properties'][prop].tolist()
             # Convert information to yaml and write to file
-            yaml.dump(info, handle, default_flow_style=False)
+            yaml.dump(info,
+                      handle,
+                      Dumper=YamlDumper,
+                      default_flow_style=False)
 
     def log_results(self, metrics):
         """
@@ -628,9 +938,12 @@ class Logger:
                 represent the name with which the values should be stored.
         """
         # Parse experiment yaml file and add results
-        with open(self.path + os.sep + "experiment.yaml", 'r') as stream:
+        with open(self.path_experiment, 'r') as stream:
             experiment = yaml.safe_load(stream)
         experiment['results'] = metrics
         # Write new content to file
-        with open(self.path + os.sep + "experiment.yaml", 'w') as handle:
-            yaml.dump(experiment, handle, default_flow_style=False)
+        with open(self.path_experiment, 'w') as handle:
+            yaml.dump(experiment,
+                      handle,
+                      Dumper=YamlDumper,
+                      default_flow_style=False)
@@ -15,6 +15,12 @@ def get_time():
     return int(round(time.time() * 1000.0))/1000.0
 
 
+# Returns the value of a monotonic, high resolution clock in seconds. Only
+# differences between values are meaningful, which makes it suitable for timing
+# code. Bound directly to avoid a wrapper call.
+get_precise_time = time.perf_counter
+
+
 def get_datetime():
     """
     Returns a string containing the current date and time
@@ -46,11 +52,14 @@ def create_unique_folder(path, prefered):
     folder_created = False
     i = 0
     while not folder_created:
-        if not os.path.exists(folder_path):
-            # Folder does not exist, create it and stop the while loop
+        try:
+            # Attempt to create the folder and stop the while loop if it
+            # succeeds. Creation is attempted directly (instead of checking
+            # for existence first), so that concurrent processes can never
+            # end up with the same folder.
             os.makedirs(folder_path)
             folder_created = True
-        else:
+        except FileExistsError:
             # Folder already exists, append _# to the name and try again
             i += 1
             folder_path = path + os.sep + prefered + '_' + str(i)
@@ -29,6 +29,19 @@ class TmpProcedure(proc.Procedure):
         pass
 
 
+class TmpProcedureFailing(TmpProcedure):
+    def __init__(self):
+        super(TmpProcedureFailing, self).__init__()
+        self.allow_function = True
+        self.n_calls = 0
+
+    def __call__(self, function):
+        self.n_calls += 1
+        if self.n_calls > 2:
+            raise RuntimeError("Procedure failed")
+        return super(TmpProcedureFailing, self).__call__(function)
+
+
 class TmpExperimentCorrect(exp.Experiment):
     def make_metrics(self):
         return {}
@@ -116,14 +129,18 @@ def test_experiment_stopcriterion():
     path = "./tmpexperiment"
     experiment = TmpExperimentCorrect(procedure, path)
     # Test if stopping criterion is correctly triggered
-    experiment.n_sampled = 0
     experiment.finish_line = 1001
     x, y = np.random.rand(1002, 2), np.random.rand(1000, 1)
+    experiment.n_sampled = 1002
     assert experiment._stop_experiment(x, y) is True
-    experiment.n_sampled = 0
+    experiment.n_sampled = 1001
     assert experiment._stop_experiment(x[:-1], y[:-1]) is True
-    experiment.n_sampled = 0
+    experiment.n_sampled = 1000
     assert experiment._stop_experiment(x[:-2], y[:-2]) is False
+    # Test that no finish line never stops the experiment
+    experiment.n_sampled = 1002
+    experiment.finish_line = None
+    assert experiment._stop_experiment(x, y) is False
 
 
 def test_experiment_perform():
@@ -158,6 +175,55 @@ def test_experiment_perform():
     shutil.rmtree(path)
 
 
+def test_experiment_perform_exception():
+    procedure = TmpProcedureFailing()
+    path = "./tmpexperiment"
+    experiment = TmpExperimentCorrect(procedure, path)
+    # Test that logs of procedure calls before the exception are written
+    with pytest.raises(RuntimeError):
+        experiment.run(func.GaussianShells())
+    folder = path + os.sep + 'gaussianshells' + os.sep
+    calls = pd.read_csv(folder + 'procedurecalls.csv')
+    assert len(calls) == 2
+    samples = pd.read_csv(folder + 'samples.csv')
+    assert len(samples) == 200
+    shutil.rmtree(path)
+
+
+def set_procedure_parameter(experiment):
+    experiment.procedure.a = 20
+
+
+def test_experiment_run_parallel():
+    procedure = TmpProcedure()
+    procedure.allow_function = True
+    path = "./tmpexperiment"
+    functions = [func.GaussianShells(), func.Rosenbrock()]
+    TmpExperimentCorrect.run_parallel(procedure,
+                                      path,
+                                      functions,
+                                      n_workers=2,
+                                      finish_line=200)
+    # Check if each function got its own folder with logs
+    for name in ['gaussianshells', 'rosenbrock']:
+        assert os.path.exists(path + os.sep + name + '/samples.csv') is True
+        assert os.path.exists(path + os.sep + name +
+                              '/experiment.yaml') is True
+    assert os.path.exists(path + os.sep + 'benchmarks.yaml') is True
+    shutil.rmtree(path)
+    # Check that experiments are configured in the workers
+    TmpExperimentCorrect.run_parallel(procedure,
+                                      path,
+                                      [func.GaussianShells()],
+                                      n_workers=1,
+                                      configure=set_procedure_parameter,
+                                      finish_line=200)
+    with open(path + "/gaussianshells/experiment.yaml", 'r') as stream:
+        log = yaml.safe_load(stream)
+    assert log['procedure']['properties'] == {'a': 20}
+    shutil.rmtree(path)
+
+
 def test_experiment_optimisation():
     procedure = TmpProcedure()
     path = "./tmpexperiment"
@@ -175,6 +241,11 @@ def test_experiment_optimisation():
     experiment._event_new_samples(x, y)
     assert np.array_equal(experiment.best_x[0], x[m]) is True
     assert np.array_equal(experiment.best_y[0], y[m]) is True
+    assert experiment.best_value == y[m]
+    # Test that a batch without improvement leaves the minimum untouched
+    experiment._event_new_samples(x, y + 1)
+    assert np.array_equal(experiment.best_x[0], x[m]) is True
+    assert experiment.best_value == y[m]
     # Test make metrics function
     metrics = experiment.make_metrics()
     assert isinstance(experiment.make_metrics(), dict)
@@ -182,6 +253,33 @@ def test_experiment_optimisation():
     assert metrics['best_value'] == y[m].tolist()
 
 
+def test_experiment_optimisation_multiple_minima():
+    procedure = TmpProcedure()
+    path = "./tmpexperiment"
+    experiment = exp.OptimisationExperiment(procedure, path)
+    experiment.detect_multiple_minima(threshold_x=0.5, tollerance_y=0.5)
+    experiment._event_start_experiment()
+    x_best, y_best = np.array([[0.0, 0.0]]), np.array([[0.0]])
+    experiment._event_new_samples(x_best, y_best)
+    # A far away point within tollerance_y of the best value is a secundary
+    # minimum
+    x_near, y_near = np.array([[1.0, 1.0]]), np.array([[0.3]])
+    experiment._event_new_samples(x_near, y_near)
+    assert len(experiment.best_x) == 2
+    assert np.array_equal(experiment.best_y, np.array([[0.0], [0.3]]))
+    # A far away point that is worse than the best value by more than
+    # tollerance_y is not a secundary minimum, even if it is the best point
+    # of its own batch
+    x_worse, y_worse = np.array([[-1.0, -1.0]]), np.array([[0.8]])
+    experiment._event_new_samples(x_worse, y_worse)
+    assert len(experiment.best_x) == 2
+    best_x, best_y = experiment._find_minima(x_worse, y_worse,
+                                             experiment.best_x,
+                                             experiment.best_y)
+    assert np.array_equal(best_x, experiment.best_x)
+    assert np.array_equal(best_y, experiment.best_y)
+
+
 def test_experiment_posteriorsampling():
     procedure = TmpProcedure()
     path = "./tmpexperiment"
@@ -266,6 +364,7 @@ def test_logger_logsamples():
     y = np.random.rand(1000, 1).reshape(-1, 1)
     total = np.hstack((x, y))
     log.log_samples(x, y)
+    log.flush()
     # Read log
     data = np.genfromtxt(basepath + os.sep + subfolder + os.sep +
                          'samples.csv',
@@ -274,6 +373,7 @@ def test_logger_logsamples():
     assert np.array_equal(total, data[:, 1:]) is True
     # Add new data
     log.log_samples(x, y)
+    log.flush()
     # Read log
     data = np.genfromtxt(basepath + os.sep + subfolder + os.sep +
                          'samples.csv',
@@ -283,6 +383,34 @@ def test_logger_logsamples():
     shutil.rmtree(basepath + os.sep + subfolder)
 
 
+def test_logger_logsamples_binary():
+    basepath = '.'
+    subfolder = 'tmplog'
+    log = exp.Logger(basepath, subfolder, binary_logging=True)
+    assert log.path_samples == './tmplog' + os.sep + 'samples.npy'
+    # Check that the samples file is only created once samples are logged
+    log.flush()
+    assert os.path.exists(log.path_samples) is False
+    # Log samples in two procedure calls
+    x = np.random.rand(1000, 3)
+    y = np.random.rand(1000, 1)
+    log.procedure_calls = 1
+    log.log_samples(x, y)
+    log.flush()
+    assert np.load(log.path_samples).shape == (1000, 5)
+    log.procedure_calls = 2
+    log.log_samples(x, y)
+    log.flush(close=True)
+    # Read log
+    data = np.load(log.path_samples)
+    assert data.shape == (2000, 5)
+    assert np.array_equal(data[:1000, 0], np.ones(1000)) is True
+    assert np.array_equal(data[1000:, 0], 2 * np.ones(1000)) is True
+    assert np.array_equal(np.hstack((x, y)), data[:1000, 1:]) is True
+    assert np.array_equal(np.hstack((x, y)), data[1000:, 1:]) is True
+    shutil.rmtree(log.path)
+
+
 def test_logger_procedurecalls():
     basepath = '.'
     subfolder = 'tmplog'
@@ -292,6 +420,7 @@ def test_logger_procedurecalls():
     # Log procedure calls
     log.log_procedure_calls(5, 9, 3)
     log.log_procedure_calls(1, 2, 6)
+    log.flush()
     # Read procedure call log
     call_log = np.genfromtxt(log.path + os.sep + 'procedurecalls.csv',
                              delimiter=',',
@@ -311,6 +440,7 @@ def test_logger_functioncalls():
     function = func.GaussianShells()
     function.counter = [[10, 3, 1], [9, 2, 0]]
     log.log_function_calls(function)
+    log.flush()
     # Read function call log
     call_log = pd.read_csv(log.path + os.sep + 'functioncalls.csv')
     reference = np.array([[10, 10, 3, 1], [10, 9, 2, 0]])